@@ -1,6 +1,7 @@
 """Main Claude Dashboard application with sidebar navigation."""
 
 import asyncio
+import importlib
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.widgets import Footer, Label
@@ -11,12 +12,6 @@ from claude_dashboard.sidebar import Sidebar
 from claude_dashboard.themes import get_current_theme, get_available_themes, set_theme
 from claude_dashboard.widgets.custom_header import CustomHeader
 from claude_dashboard.screens.agents import AgentsScreen
-from claude_dashboard.screens.skills import SkillsScreen
-from claude_dashboard.screens.settings import SettingsScreen
-from claude_dashboard.screens.sessions import SessionsScreen
-from claude_dashboard.screens.relationships import RelationshipsScreen
-from claude_dashboard.screens.analytics import AnalyticsScreen
-from claude_dashboard.screens.github_import import GitHubImportScreen
 from claude_dashboard.config.claude_config import ClaudeConfig, ConfigChanged
 from claude_dashboard.utils.updater import check_for_update
 
@@ -31,14 +26,15 @@ class ClaudeDashboard(App):
     TITLE = "Claude Dashboard"
     SUB_TITLE = "Agent & Skill Manager"
 
-    SCREENS = {
-        "Agents": AgentsScreen,
-        "Skills": SkillsScreen,
-        "Settings": SettingsScreen,
-        "Sessions": SessionsScreen,
-        "Analytics": AnalyticsScreen,
-        "Relationships": RelationshipsScreen,
-        "Import from GitHub": GitHubImportScreen,
+    # Sidebar item -> "module:Class", imported the first time it's shown
+    CONTENT_SCREENS = {
+        "Agents": "claude_dashboard.screens.agents:AgentsScreen",
+        "Skills": "claude_dashboard.screens.skills:SkillsScreen",
+        "Settings": "claude_dashboard.screens.settings:SettingsScreen",
+        "Sessions": "claude_dashboard.screens.sessions:SessionsScreen",
+        "Analytics": "claude_dashboard.screens.analytics:AnalyticsScreen",
+        "Relationships": "claude_dashboard.screens.relationships:RelationshipsScreen",
+        "Import from GitHub": "claude_dashboard.screens.github_import:GitHubImportScreen",
     }
 
     BINDINGS = [
@@ -116,9 +112,7 @@ class ClaudeDashboard(App):
         self._config = ClaudeConfig()
 
         def on_config_change():
-            # Invalidate cache when files change
-            if self._config:
-                self._config.invalidate_cache()
+            # ClaudeConfig has already invalidated the changed files' entries
             self.post_message(ConfigChanged())
 
         # Only start watching if not already watching
@@ -165,6 +159,12 @@ class ClaudeDashboard(App):
             except Exception:
                 pass
 
+    def _create_screen(self, item: str):
+        """Import and instantiate the content screen for a sidebar item."""
+        module_name, _, class_name = self.CONTENT_SCREENS[item].partition(":")
+        module = importlib.import_module(module_name)
+        return getattr(module, class_name)()
+
     def _cleanup_current_screen(self) -> None:
         """Properly cleanup current screen to prevent memory leaks."""
         if self._current_screen:
@@ -189,8 +189,8 @@ class ClaudeDashboard(App):
             child.remove()
         content_area.remove_children()
 
-        if event.item in self.SCREENS:
-            self._current_screen = self.SCREENS[event.item]()
+        if event.item in self.CONTENT_SCREENS:
+            self._current_screen = self._create_screen(event.item)
             content_area.mount(self._current_screen)
 
     def on_sidebar_selected(self, event: Sidebar.Selected) -> None:
@@ -205,8 +205,8 @@ class ClaudeDashboard(App):
             child.remove()
         content_area.remove_children()
 
-        if event.item in self.SCREENS:
-            self._current_screen = self.SCREENS[event.item]()
+        if event.item in self.CONTENT_SCREENS:
+            self._current_screen = self._create_screen(event.item)
             content_area.mount(self._current_screen)
 
     def action_command_palette(self) -> None:
@@ -245,8 +245,8 @@ class ClaudeDashboard(App):
                 child.remove()
             content_area.remove_children()
 
-            if item in self.SCREENS:
-                self._current_screen = self.SCREENS[item]()
+            if item in self.CONTENT_SCREENS:
+                self._current_screen = self._create_screen(item)
                 content_area.mount(self._current_screen)
 
     def on_key(self, event: events.Key) -> None:
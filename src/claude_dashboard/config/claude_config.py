@@ -1,18 +1,86 @@
 """Claude configuration singleton for accessing ~/.claude directory."""
 
+import codecs
 import copy
 import json
+import os
+import re
+import sys
+import tempfile
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
 from textual.message import Message
 
-from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+if TYPE_CHECKING:
+    from watchdog.observers.api import BaseObserver
+
 from claude_dashboard.utils.frontmatter import parse_frontmatter
 
+# Bytes read from each agent/skill file when loading metadata
+HEADER_READ_SIZE = 4096
+# Parse changed files on a thread pool once there are at least this many
+PARALLEL_PARSE_MIN = 4
+PARSE_WORKERS = 8
+# Parsed metadata persisted across runs, stored in the Claude directory
+CACHE_FILE_NAME = "dashboard-cache.json"
+CACHE_VERSION = 3
+# Frontmatter fields whose values often repeat across files; interned on load
+INTERNED_FIELDS = ("name", "description", "model", "author")
+# Environment variable names whose values are masked in get_settings().
+# AUTH is skipped when it's part of an AUTHOR word (e.g. GIT_AUTHOR_NAME).
+_SENSITIVE_KEY = re.compile(
+    r"KEY|TOKEN|SECRET|PASSWORD|CREDENTIAL|AUTH(?!ORS?(?:_|$))", re.IGNORECASE
+)
+
+
+def _read_header(path: str) -> str:
+    """Read the start of a markdown file, enough to cover its frontmatter.
+
+    Reads at most HEADER_READ_SIZE bytes, continuing to the end of the file
+    only if the closing '---' delimiter hasn't been seen yet. For larger
+    files the returned text is therefore a prefix of the file.
+
+    Raises:
+        OSError: If the file can't be read
+        UnicodeDecodeError: If the bytes read aren't valid UTF-8
+    """
+    with open(path, "rb") as f:
+        head = f.read(HEADER_READ_SIZE)
+        complete = len(head) < HEADER_READ_SIZE
+        if not complete and b"\n---\n" not in head and b"\n---\r" not in head:
+            head += f.read()
+            complete = True
+
+    # An incremental decoder tolerates a multi-byte character cut at the end
+    return codecs.getincrementaldecoder("utf-8")().decode(head, final=complete)
+
+
+def _json_safe(value: Any) -> bool:
+    """Return True if value survives a JSON round trip unchanged."""
+    if value is None or isinstance(value, (str, int, float)):
+        return True
+    if isinstance(value, list):
+        return all(_json_safe(item) for item in value)
+    if isinstance(value, dict):
+        return all(
+            isinstance(key, str) and _json_safe(item) for key, item in value.items()
+        )
+    return False
+
+
+def _intern_fields(meta: dict[str, Any]) -> dict[str, Any]:
+    """Intern repeated string fields in place so duplicates share storage."""
+    for field in INTERNED_FIELDS:
+        value = meta.get(field)
+        if type(value) is str:
+            meta[field] = sys.intern(value)
+    return meta
+
 
 class ClaudeConfig:
     """Singleton for accessing Claude Code configuration."""
@@ -46,6 +114,77 @@ class ClaudeConfig:
         self._cache_timestamps = {}
         self._cache_ttl = 5  # seconds
         self._cache_lock = threading.Lock()
+        # Parsed frontmatter per file, keyed by path and validated by
+        # (st_mtime_ns, st_size) so unchanged files are never re-parsed.
+        # Guarded by _meta_lock: the watcher thread and screen workers
+        # update it while other threads scan it.
+        self._meta_cache: dict[str, tuple[int, int, dict[str, Any]]] = {}
+        self._meta_lock = threading.Lock()
+        # Masked settings.json, validated the same way
+        self._settings_cache: tuple[int, int, dict[str, Any]] | None = None
+        self._load_disk_cache()
+
+    @property
+    def _cache_file(self) -> Path:
+        return self.claude_dir / CACHE_FILE_NAME
+
+    def _load_disk_cache(self) -> None:
+        """Seed the metadata cache from the previous run's cache file.
+
+        Entries are still revalidated against each file's mtime and size,
+        so a stale or foreign cache file can't produce wrong results.
+        """
+        try:
+            with open(self._cache_file, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != CACHE_VERSION:
+                return
+            meta_cache = {
+                path: (mtime_ns, size, _intern_fields(meta))
+                for path, (mtime_ns, size, meta) in data["files"].items()
+                if isinstance(meta, dict)
+                and meta.get("path") == path
+                and isinstance(meta.get("id"), str)
+            }
+            with self._meta_lock:
+                self._meta_cache = meta_cache
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            # Missing or corrupted cache file, start cold
+            return
+
+    def _save_disk_cache(self) -> None:
+        """Atomically write the metadata cache for the next run.
+
+        The cache is serialized while holding _meta_lock, so the dump sees
+        a consistent set of entries; only the file write happens outside.
+        """
+        try:
+            with self._meta_lock:
+                payload = json.dumps({
+                    "version": CACHE_VERSION,
+                    "files": {
+                        path: [mtime_ns, size, meta]
+                        for path, (mtime_ns, size, meta) in self._meta_cache.items()
+                        if _json_safe(meta)
+                    },
+                })
+        except (TypeError, ValueError, RuntimeError):
+            return
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.claude_dir, prefix=".dashboard-cache-", suffix=".tmp"
+            )
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, self._cache_file)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
 
     def _get_cached(self, key: str) -> Any | None:
         """Get cached data if still valid."""
@@ -63,11 +202,132 @@ class ClaudeConfig:
             self._cache_timestamps[key] = time.time()
 
     def invalidate_cache(self) -> None:
-        """Clear all cached data."""
+        """Clear all cached data.
+
+        Per-file metadata is kept, since it is revalidated against the
+        file's mtime and size on every lookup.
+        """
         with self._cache_lock:
             self._cache.clear()
             self._cache_timestamps.clear()
 
+    def _update_one(self, path: str) -> None:
+        """Invalidate cached data affected by a change to a single file.
+
+        Drops the file's parsed metadata and only the list cache it
+        belongs to, so the next read re-parses just that file. Called on
+        the watcher thread.
+        """
+        with self._meta_lock:
+            self._meta_cache.pop(path, None)
+
+        if path.startswith(os.path.join(self.claude_dir, "agents", "")):
+            key = "agents"
+        elif path.startswith(os.path.join(self.claude_dir, "skills", "")):
+            key = "skills"
+        else:
+            if path == os.path.join(self.claude_dir, "settings.json"):
+                self._settings_cache = None
+            return
+
+        with self._cache_lock:
+            self._cache.pop(key, None)
+            self._cache_timestamps.pop(key, None)
+
+    def _parse_file(
+        self, item_id: str, path: str, st: os.stat_result
+    ) -> tuple[int, int, dict[str, Any]] | None:
+        """Parse a markdown file's frontmatter into the metadata cache.
+
+        Only the start of large files is read. When the body was cut off,
+        'content' is None rather than a fragment; read 'path' to get the
+        full text. Files that can't be read are dropped from the cache. The entry's 'id'
+        and 'path' are filled in before it is published, and cached
+        metadata is never modified afterwards.
+
+        Returns:
+            The new cache entry, or None if the file couldn't be read
+        """
+        try:
+            header = _read_header(path)
+        except (OSError, UnicodeDecodeError):
+            with self._meta_lock:
+                self._meta_cache.pop(path, None)
+            return None
+        data = parse_frontmatter(header)
+        if len(header.encode("utf-8")) < st.st_size:
+            # Only a prefix of the body was read
+            data["content"] = None
+        data["id"] = item_id
+        data["path"] = path
+        entry = (st.st_mtime_ns, st.st_size, _intern_fields(data))
+        with self._meta_lock:
+            self._meta_cache[path] = entry
+        return entry
+
+    def _load_entries(
+        self, root: Path, entries: list[tuple[str, str, os.stat_result | None]]
+    ) -> list[dict[str, Any]]:
+        """Load metadata for (id, path, stat) entries, parsing only changed files.
+
+        When enough files need parsing, they are read on a thread pool so
+        their I/O overlaps. Unreadable files are skipped. Each result is a
+        copy of the cached metadata. Cache entries
+        under root that weren't listed are dropped, and the disk cache is
+        rewritten if anything changed.
+        """
+        found = []
+        for item_id, path, st in entries:
+            if st is None:
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+            found.append((item_id, path, st))
+
+        # Entries used for this call's results, so a concurrent
+        # invalidation can't drop a file between parsing and collecting
+        current = {}
+        stale = []
+        with self._meta_lock:
+            for item_id, path, st in found:
+                cached = self._meta_cache.get(path)
+                if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    current[path] = cached
+                else:
+                    stale.append((item_id, path, st))
+
+        if len(stale) >= PARALLEL_PARSE_MIN:
+            with ThreadPoolExecutor(max_workers=min(PARSE_WORKERS, len(stale))) as pool:
+                parsed = list(pool.map(lambda item: self._parse_file(*item), stale))
+        else:
+            parsed = [self._parse_file(*item) for item in stale]
+        for (_, path, _), entry in zip(stale, parsed):
+            current[path] = entry
+
+        prefix = os.path.join(root, "")
+        found_paths = {path for _, path, _ in found}
+        with self._meta_lock:
+            removed = [
+                path
+                for path in self._meta_cache
+                if path.startswith(prefix) and path not in found_paths
+            ]
+            for path in removed:
+                del self._meta_cache[path]
+
+        if stale or removed:
+            self._save_disk_cache()
+
+        results = []
+        for item_id, path, _ in found:
+            cached = current[path]
+            if cached is None:
+                continue
+            # Shallow copy, so callers can't change the cached metadata
+            results.append(dict(cached[2]))
+        return results
+
     def get_agents(self) -> list[dict[str, Any]]:
         """Get all agents from ~/.claude/agents/*.md"""
         cached = self._get_cached("agents")
@@ -78,17 +338,19 @@ class ClaudeConfig:
         if not agents_dir.exists():
             return []
 
-        agents = []
-        for file in agents_dir.glob("*.md"):
-            try:
-                data = parse_frontmatter(file.read_text())
-                data["id"] = file.stem
-                data["path"] = str(file)
-                agents.append(data)
-            except (OSError, PermissionError, UnicodeDecodeError):
-                # Skip files that can't be read
-                continue
-
+        entries = []
+        with os.scandir(agents_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".md"):
+                    continue
+                try:
+                    if entry.is_file():
+                        entries.append((entry.name[:-3], entry.path, entry.stat()))
+                except OSError:
+                    # Skip entries that vanished or can't be stat'ed
+                    continue
+
+        agents = self._load_entries(agents_dir, entries)
         self._set_cached("agents", agents)
         return agents
 
@@ -102,38 +364,42 @@ class ClaudeConfig:
         if not skills_dir.exists():
             return []
 
-        skills = []
-        for item in skills_dir.iterdir():
-            if item.is_dir() or item.is_symlink():
-                skill_file = item / "SKILL.md"
-                if skill_file.exists():
-                    try:
-                        data = parse_frontmatter(skill_file.read_text())
-                        data["id"] = item.name
-                        data["path"] = str(skill_file)
-                        skills.append(data)
-                    except (OSError, PermissionError, UnicodeDecodeError):
-                        # Skip files that can't be read
-                        continue
+        # scandir serves is_dir() from the dirent, avoiding a stat per entry
+        with os.scandir(skills_dir) as it:
+            entries = [
+                (entry.name, os.path.join(entry.path, "SKILL.md"), None)
+                for entry in it
+                if entry.is_dir()
+            ]
 
+        # Skill directories without a SKILL.md fail the stat and are skipped
+        skills = self._load_entries(skills_dir, entries)
         self._set_cached("skills", skills)
         return skills
 
     def get_settings(self) -> dict[str, Any]:
-        """Get settings with sensitive values masked."""
-        cached = self._get_cached("settings")
-        if cached is not None:
-            return cached
+        """Get settings with sensitive values masked.
 
+        The parsed result is reused until settings.json's mtime or size
+        changes, including the error result for an invalid file.
+        """
         settings_file = self.claude_dir / "settings.json"
-        if not settings_file.exists():
+        try:
+            st = os.stat(settings_file)
+        except FileNotFoundError:
             return {}
 
+        cached = self._settings_cache
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
         try:
             with open(settings_file) as f:
                 settings = json.load(f)
         except json.JSONDecodeError as e:
-            return {"error": f"Invalid JSON in settings.json: {e}"}
+            settings = {"error": f"Invalid JSON in settings.json: {e}"}
+            self._settings_cache = (st.st_mtime_ns, st.st_size, settings)
+            return settings
 
         # Create a copy before masking to avoid modifying original
         settings = copy.copy(settings)  # Shallow copy is enough for masking
@@ -141,13 +407,13 @@ class ClaudeConfig:
         # Mask API keys and tokens
         if "env" in settings:
             for key in settings["env"]:
-                if any(word in key.upper() for word in ["KEY", "TOKEN", "SECRET"]):
+                if _SENSITIVE_KEY.search(key):
                     settings["env"][key] = "••••••••"
 
-        self._set_cached("settings", settings)
+        self._settings_cache = (st.st_mtime_ns, st.st_size, settings)
         return settings
 
-    def start_watching(self, callback: Callable[[], None]) -> Observer:
+    def start_watching(self, callback: Callable[[], None]) -> "BaseObserver":
         """Start watching for config changes.
 
         Args:
@@ -156,8 +422,11 @@ class ClaudeConfig:
         Returns:
             Observer instance that can be stopped later
         """
+        # Deferred: picks and loads the platform backend (inotify, FSEvents, ...)
+        from watchdog.observers import Observer
+
         observer = Observer()
-        handler = ConfigWatcher(callback)
+        handler = ConfigWatcher(callback, on_path_changed=self._update_one)
         observer.schedule(handler, str(self.claude_dir), recursive=True)
         observer.start()
         return observer
@@ -170,17 +439,46 @@ class ConfigChanged(Message):
 class ConfigWatcher(FileSystemEventHandler):
     """Watches for changes to Claude config files with debouncing."""
 
-    def __init__(self, callback: Callable[[], None], debounce_seconds: float = 0.5):
+    def __init__(
+        self,
+        callback: Callable[[], None],
+        debounce_seconds: float = 0.5,
+        on_path_changed: Callable[[str], None] | None = None,
+    ):
         super().__init__()
         self.callback = callback
         self.debounce_seconds = debounce_seconds
+        # Called immediately for each changed path, before the debounced callback
+        self.on_path_changed = on_path_changed
         self._pending = False
         self._lock = threading.Lock()
         self._timer = None
 
     def on_modified(self, event):
         """Handle file modification events with debouncing."""
-        if event.src_path.endswith(".md") or event.src_path.endswith(".json"):
+        self._handle_path(event.src_path)
+
+    def on_created(self, event):
+        """Handle file creation events with debouncing."""
+        self._handle_path(event.src_path)
+
+    def on_deleted(self, event):
+        """Handle file deletion events with debouncing."""
+        self._handle_path(event.src_path)
+
+    def on_moved(self, event):
+        """Handle renames, including atomic saves that replace a file."""
+        self._handle_path(event.src_path)
+        self._handle_path(event.dest_path)
+
+    def _handle_path(self, path: str) -> None:
+        """Report a changed config file and schedule the callback."""
+        if os.path.basename(path) == CACHE_FILE_NAME:
+            # Our own metadata cache, not user configuration
+            return
+        if path.endswith(".md") or path.endswith(".json"):
+            if self.on_path_changed:
+                self.on_path_changed(path)
             self._trigger_callback()
 
     def _trigger_callback(self):
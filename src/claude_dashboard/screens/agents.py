@@ -1,10 +1,13 @@
 """Agents screen showing list of agents from ~/.claude/agents/."""
 
+from pathlib import Path
 from textual.app import ComposeResult
 from textual.screen import ModalScreen
 from textual.containers import Vertical
 from textual.widgets import DataTable, Button, Label, Input
 from claude_dashboard.config.claude_config import ClaudeConfig
+from claude_dashboard.utils.frontmatter import parse_frontmatter
+from claude_dashboard.utils.search import SearchIndex
 
 
 class AgentDetailScreen(ModalScreen):
@@ -34,11 +37,22 @@ class AgentDetailScreen(ModalScreen):
             yield Label("Skills: None assigned")
 
         yield Label(f"\n{self.agent_data.get('description', 'No description')}")
-        yield Label(f"\n[b]Content:[/b]\n{self.agent_data.get('content', '')[:500]}")
+        yield Label(f"\n[b]Content:[/b]\n{self._content()[:500]}")
         yield Button("Assign Skills", id="assign_skills", variant="warning")
         yield Button("Edit", variant="primary")
         yield Button("Close", id="close")
 
+    def _content(self) -> str:
+        """Return the agent's body, reading the file if only a prefix was cached."""
+        content = self.agent_data.get("content", "")
+        if content is not None:
+            return content
+        try:
+            text = Path(self.agent_data["path"]).read_text(encoding="utf-8")
+        except (KeyError, OSError, UnicodeDecodeError):
+            return ""
+        return parse_frontmatter(text).get("content", "")
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "close":
             self.app.pop_screen()
@@ -83,6 +97,7 @@ class AgentsScreen(Vertical):
         # Load agents from config and store for filtering
         config = ClaudeConfig()
         self.agents = config.get_agents()
+        self._search = SearchIndex(self.agents)
 
         self._populate_table(self.agents)
 
@@ -91,13 +106,15 @@ class AgentsScreen(Vertical):
         table = self.query_one("#agents_table", DataTable)
         table.clear()
 
-        for agent in agents:
-            table.add_row(
+        table.add_rows(
+            (
                 agent["id"],
                 agent.get("name", agent["id"]),
                 agent.get("description", "")[:50],
                 agent.get("model", "")
             )
+            for agent in agents
+        )
 
     def on_data_table_row_selected(self, event):
         """Handle row selection."""
@@ -116,15 +133,7 @@ class AgentsScreen(Vertical):
     def on_input_changed(self, event: Input.Changed) -> None:
         """Filter table based on input."""
         if event.input.id == "filter_input":
-            search_term = event.value.lower()
-
-            filtered = [
-                agent for agent in self.agents
-                if search_term in agent["id"].lower() or
-                   search_term in agent.get("name", "").lower() or
-                   search_term in agent.get("description", "").lower()
-            ]
-
+            filtered = self._search.filter(event.value)
             self._populate_table(filtered)
 
     def on_button_pressed(self, event: Button.Pressed):
@@ -87,10 +87,14 @@ class GitHubImportScreen(Vertical):
         config = ClaudeConfig()
         skills = config.get_skills()
 
-        for skill in skills:
-            name = skill.get("name", skill.get("id", "Unknown"))
-            desc = skill.get("description", "No description")
-            table.add_row(name, desc, "[green]Installed[/green]")
+        table.add_rows(
+            (
+                skill.get("name", skill.get("id", "Unknown")),
+                skill.get("description", "No description"),
+                "[green]Installed[/green]",
+            )
+            for skill in skills
+        )
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -221,11 +225,14 @@ class GitHubImportScreen(Vertical):
         config = ClaudeConfig()
         installed = {s["id"] for s in config.get_skills()}
 
-        for skill in self._available_skills:
-            status = "[red]Not installed[/red]"
-            if skill["id"] in installed:
-                status = "[green]Installed[/green]"
-            table.add_row(skill["name"], skill["description"], status)
+        table.add_rows(
+            (
+                skill["name"],
+                skill["description"],
+                "[green]Installed[/green]" if skill["id"] in installed else "[red]Not installed[/red]",
+            )
+            for skill in self._available_skills
+        )
 
     def _import_selected_skill(self):
         """Import the selected skill."""
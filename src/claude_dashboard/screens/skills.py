@@ -1,9 +1,12 @@
 """Skills screen showing list of skills from ~/.claude/skills/."""
 
+from textual import work
 from textual.app import ComposeResult
 from textual.containers import Vertical
 from textual.widgets import DataTable, Label, Input
+from textual.worker import get_current_worker
 from claude_dashboard.config.claude_config import ClaudeConfig
+from claude_dashboard.utils.search import SearchIndex
 
 
 class SkillsScreen(Vertical):
@@ -18,49 +21,66 @@ class SkillsScreen(Vertical):
     }
     """
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.skills: list = []
+        self._search = SearchIndex([])
+
     def compose(self) -> ComposeResult:
         yield Input(placeholder="Filter skills...", id="filter_input")
         yield DataTable(id="skills_table")
 
     def on_mount(self):
         table = self.query_one("#skills_table", DataTable)
-        table.add_columns("ID", "Name", "Description")
+        # on_mount is re-run on config changes; only add columns once
+        if not table.columns:
+            table.add_columns("ID", "Name", "Description")
 
-        config = ClaudeConfig()
-        self.skills = config.get_skills()
+        self._load_skills()
+
+    @work(thread=True, exclusive=True)
+    def _load_skills(self) -> None:
+        """Load skills and build table rows off the UI thread."""
+        skills = ClaudeConfig().get_skills()
+        search = SearchIndex(skills)
+        rows = self._build_rows(skills)
+
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._show_skills, skills, search, rows)
 
-        if not self.skills:
+    def _show_skills(self, skills: list, search: SearchIndex, rows: list[tuple]) -> None:
+        """Install freshly loaded skills and fill the table (UI thread)."""
+        self.skills = skills
+        self._search = search
+
+        table = self.query_one("#skills_table", DataTable)
+        table.clear()
+        if not skills:
             # Show message if no skills found
             table.add_row("", "No skills found", "Check ~/.claude/skills/")
             return
+        table.add_rows(rows)
 
-        self._populate_table(self.skills)
+    @staticmethod
+    def _build_rows(skills: list) -> list[tuple]:
+        """Build (id, name, description) table rows for the given skills."""
+        rows = []
+        for skill in skills:
+            description = skill.get("description", "")
+            display_desc = description[:50] + "..." if len(description) > 50 else description
+            rows.append((skill["id"], skill.get("name", skill["id"]), display_desc))
+        return rows
 
     def _populate_table(self, skills: list):
         """Populate table with given skills."""
         table = self.query_one("#skills_table", DataTable)
         table.clear()
-
-        for skill in skills:
-            description = skill.get("description", "")
-            display_desc = description[:50] + "..." if len(description) > 50 else description
-            table.add_row(
-                skill["id"],
-                skill.get("name", skill["id"]),
-                display_desc
-            )
+        table.add_rows(self._build_rows(skills))
 
     def on_input_changed(self, event: Input.Changed) -> None:
         """Filter table based on input."""
         if event.input.id == "filter_input":
-            search_term = event.value.lower()
-
-            filtered = [
-                skill for skill in (self.skills or [])
-                if search_term in skill["id"].lower() or
-                   search_term in skill.get("name", "").lower() or
-                   search_term in skill.get("description", "").lower()
-            ]
+            filtered = self._search.filter(event.value)
 
             if not filtered:
                 table = self.query_one("#skills_table", DataTable)
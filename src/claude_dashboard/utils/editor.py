@@ -7,6 +7,9 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Module-level reference so tests can swap it without touching subprocess
+_subprocess_call = subprocess.call
+
 
 def open_editor(file_path: Path | str) -> None:
     """Open file in user's configured editor.
@@ -25,7 +28,7 @@ def open_editor(file_path: Path | str) -> None:
     editor = os.environ.get("EDITOR", "vi")
 
     try:
-        result = subprocess.call([editor, str(file_path)])
+        result = _subprocess_call([editor, str(file_path)])
         if result != 0:
             logger.warning(f"Editor exited with code {result}")
     except FileNotFoundError:
@@ -2,6 +2,58 @@ import re
 import yaml
 from typing import Any
 
+# Keys and plain scalars the flat fast path accepts without PyYAML
+_SIMPLE_KEY = re.compile(r'[A-Za-z_][\w-]*\Z')
+_INDICATORS = frozenset('-?:,[]{}#&*!|>\'"%@`')
+
+
+def _is_plain_str(value: str) -> bool:
+    """Return True if YAML would resolve this plain scalar to a string."""
+    resolvers = yaml.SafeLoader.yaml_implicit_resolvers.get(value[0], [])
+    return not any(regexp.match(value) for _tag, regexp in resolvers)
+
+
+def _parse_flat_yaml(text: str) -> dict[str, Any] | None:
+    """Parse frontmatter made only of single-line `key: value` string pairs.
+
+    Returns None as soon as a line falls outside that subset (quotes,
+    lists, nesting, comments, numbers, booleans, ...), so the caller can
+    hand the text to PyYAML instead.
+    """
+    result = {}
+    for line in text.split('\n'):
+        if not line:
+            continue
+        key, sep, value = line.partition(': ')
+        value = value.strip(' ')
+        if (
+            not sep
+            or not value
+            or not _SIMPLE_KEY.match(key)
+            or value[0] in _INDICATORS
+            or value[-1] == ':'
+            or ': ' in value
+            or ' #' in value
+            or not value.isprintable()
+            or not _is_plain_str(key)
+            or not _is_plain_str(value)
+        ):
+            return None
+        result[key] = value
+    return result
+
+
+def _load_yaml(text: str) -> dict[str, Any]:
+    """Load frontmatter YAML, skipping PyYAML for flat string-only headers.
+
+    Raises:
+        yaml.YAMLError: If the text needs PyYAML and is not valid YAML
+    """
+    metadata = _parse_flat_yaml(text)
+    if metadata is None:
+        metadata = yaml.safe_load(text) or {}
+    return metadata
+
 
 def parse_frontmatter(content: str) -> dict[str, Any]:
     """Parse YAML frontmatter from markdown content.
@@ -27,7 +79,7 @@ def parse_frontmatter(content: str) -> dict[str, Any]:
     body_text = match.group(2)
 
     try:
-        metadata = yaml.safe_load(frontmatter_text) or {}
+        metadata = _load_yaml(frontmatter_text)
         metadata["content"] = body_text
         return metadata
     except yaml.YAMLError:
@@ -54,7 +106,7 @@ def update_frontmatter(content: str, updates: dict[str, Any]) -> str:
         frontmatter_text = match.group(1)
         body_text = match.group(2)
         try:
-            metadata = yaml.safe_load(frontmatter_text) or {}
+            metadata = _load_yaml(frontmatter_text)
         except yaml.YAMLError:
             metadata = {}
     else:
@@ -1,5 +1,6 @@
 """Path utilities for safe file operations."""
 
+import os
 import re
 from pathlib import Path
 
@@ -63,3 +64,28 @@ def safe_path_join(base_dir: Path, *paths: str) -> Path:
         raise ValueError(f"Path '{paths}' would escape base directory '{base_dir}'")
 
     return result
+
+
+def create_exclusive(path: Path | str, data: bytes, mode: int = 0o644) -> None:
+    """Atomically create a new file and write data to it.
+
+    Uses O_CREAT | O_EXCL so the existence check and the create happen in a
+    single syscall, with no window for another process to race us.
+
+    Args:
+        path: Path of the file to create
+        data: Bytes to write
+        mode: Permission bits for the new file
+
+    Raises:
+        FileExistsError: If the file already exists
+        OSError: If the file cannot be created or written
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
@@ -0,0 +1,55 @@
+"""Case-insensitive search over agent and skill records."""
+
+from typing import Any
+
+# Fields matched by the filter inputs on the list screens
+DEFAULT_FIELDS = ("id", "name", "description")
+
+# Lowercases ASCII letters in bytes; equivalent to str.lower() for ASCII text
+_ASCII_LOWER = bytes.maketrans(bytes(range(0x41, 0x5B)), bytes(range(0x61, 0x7B)))
+
+
+def _fold(text: str) -> bytes:
+    """Lowercase text and encode it as UTF-8 for substring matching."""
+    if text.isascii():
+        return text.encode("ascii").translate(_ASCII_LOWER)
+    return text.lower().encode("utf-8", "surrogatepass")
+
+
+class SearchIndex:
+    """Substring search over a fixed list of records.
+
+    Each record's searchable fields are lowercased and joined once, up
+    front, into UTF-8 bytes, so filtering is a single bytes scan per
+    record. When a term extends the previous one, as it does while
+    typing, only the records that matched the previous term are scanned
+    again.
+    """
+
+    def __init__(self, items: list[dict[str, Any]], fields: tuple[str, ...] = DEFAULT_FIELDS):
+        self.items = items
+        self._haystacks = [
+            _fold("\n".join(str(item.get(field) or "") for field in fields))
+            for item in items
+        ]
+        # Last non-empty filter term and the indices of its matches
+        self._last_term = b""
+        self._last_matches: list[int] = []
+
+    def filter(self, term: str) -> list[dict[str, Any]]:
+        """Return the records whose fields contain term, ignoring case."""
+        needle = _fold(term)
+        if not needle:
+            return list(self.items)
+
+        # A record can only contain term if it contained a prefix of it
+        if self._last_term and needle.startswith(self._last_term):
+            candidates = self._last_matches
+        else:
+            candidates = range(len(self._haystacks))
+
+        haystacks = self._haystacks
+        matches = [i for i in candidates if needle in haystacks[i]]
+        self._last_term = needle
+        self._last_matches = matches
+        return [self.items[i] for i in matches]
@@ -33,6 +33,10 @@ class CommandPalette(ModalScreen):
         ("Import Skills from GitHub", "import_github"),
     ]
 
+    def __init__(self):
+        super().__init__()
+        self._last_search = ""
+
     def compose(self) -> ComposeResult:
         yield Input(placeholder="Type a command...", id="command_input")
         yield DataTable(id="commands_table")
@@ -40,9 +44,7 @@ class CommandPalette(ModalScreen):
     def on_mount(self):
         table = self.query_one("#commands_table", DataTable)
         table.add_columns("Command")
-
-        for name, _ in self.COMMANDS:
-            table.add_row(name)
+        table.add_rows((name,) for name, _ in self.COMMANDS)
 
         table.cursor_type = "row"
 
@@ -53,13 +55,19 @@ class CommandPalette(ModalScreen):
     def on_input_changed(self, event: Input.Changed) -> None:
         """Filter commands based on input."""
         search = event.value.lower()
-        table = self.query_one("#commands_table", DataTable)
+        # Nothing to do if the effective filter hasn't changed
+        if search == self._last_search:
+            return
+        self._last_search = search
 
+        table = self.query_one("#commands_table", DataTable)
         table.clear()
-        table.add_columns("Command")
-        for name, cmd_id in self.COMMANDS:
-            if search in name.lower():
-                table.add_row(name)
+        if not search:
+            table.add_rows((name,) for name, _ in self.COMMANDS)
+        else:
+            table.add_rows(
+                (name,) for name, _ in self.COMMANDS if search in name.lower()
+            )
 
     def on_data_table_row_selected(self, event):
         """Execute selected command."""
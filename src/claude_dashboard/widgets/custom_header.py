@@ -29,6 +29,7 @@ class CustomHeader(Widget):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._label: Label | None = None
+        self._current_text = ""
 
     def compose(self) -> ComposeResult:
         yield Label("")
@@ -43,5 +44,9 @@ class CustomHeader(Widget):
             text = f"{title} — {subtitle}"
         else:
             text = title
+        # Skip the re-render when the title hasn't changed
+        if text == self._current_text:
+            return
         if self._label:
             self._label.update(text)
+            self._current_text = text
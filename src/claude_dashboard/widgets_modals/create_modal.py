@@ -5,9 +5,10 @@ from textual.screen import ModalScreen
 from textual.containers import Vertical, Horizontal
 from textual.widgets import Label, Input, Button, Select, RadioButton, RadioSet
 from pathlib import Path
-import random
+import secrets
 
 from claude_dashboard.config.claude_config import ConfigChanged
+from claude_dashboard.utils.path_utils import create_exclusive
 
 
 class CreateAgentWizard(ModalScreen):
@@ -46,7 +47,7 @@ class CreateAgentWizard(ModalScreen):
     def __init__(self):
         super().__init__()
         self.step = 1
-        self.generated_id = f"ag_{random.randint(1000, 9999)}"  # Generate once
+        self.generated_id = f"ag_{secrets.token_hex(2)}"  # Generate once
         self.data = {
             "name": "",
             "id": "",
@@ -170,10 +171,9 @@ description: >
 You are {self.data['name']}, a Claude AI assistant configured as a {self.data['template']} agent.
 """
 
-        # Use x mode (exclusive creation) - fails if file exists
+        # Exclusive creation - fails if file exists
         try:
-            with open(file_path, 'x') as f:
-                f.write(frontmatter)
+            create_exclusive(file_path, frontmatter.encode("utf-8"))
             self.app.notify(f"Created agent: {self.data['name']} ({self.data['id']})")
             self.app.pop_screen()
 
@@ -1,14 +1,81 @@
 """Create Skill Wizard for creating new skills."""
 
-import random
 import re
+import secrets
 from pathlib import Path
 from textual.app import ComposeResult
 from textual.screen import ModalScreen
 from textual.containers import Vertical, Horizontal
 from textual.widgets import Label, Input, Button, Select
 from claude_dashboard.config.claude_config import ConfigChanged
-from claude_dashboard.utils.path_utils import sanitize_filename
+from claude_dashboard.utils.path_utils import create_exclusive, sanitize_filename
+
+
+# Static template bodies, pre-encoded so only the small frontmatter header
+# needs encoding when a skill is created
+_TEMPLATE_BODIES: dict[str, bytes] = {
+    "api": b"""# API Integration Skill
+
+This skill provides integration with external APIs.
+
+## Usage
+
+```python
+from your_module import make_api_call
+
+result = make_api_call(endpoint, data)
+```
+
+## Configuration
+
+Add API credentials to your ~/.claude/settings.json:
+
+```json
+{
+  "env": {
+    "API_KEY": "your-api-key"
+  }
+}
+```
+""",
+    "data": b"""# Data Processing Skill
+
+This skill provides data transformation and processing capabilities.
+
+## Usage
+
+```python
+from your_module import process_data
+
+result = process_data(input_data)
+```
+
+## Features
+
+- Data validation
+- Format conversion
+- Batch processing
+""",
+    "utility": b"""# Utility Skill
+
+This skill provides various utility functions.
+
+## Usage
+
+Import and use the functions as needed:
+
+```python
+from your_module import utility_function
+
+result = utility_function(args)
+```
+
+## Functions
+
+- `function1()` - Description
+- `function2()` - Description
+""",
+}
 
 
 class CreateSkillWizard(ModalScreen):
@@ -38,7 +105,7 @@ class CreateSkillWizard(ModalScreen):
     def __init__(self):
         super().__init__()
         self.step = 1
-        self.generated_id = f"sk_{random.randint(1000, 9999)}"
+        self.generated_id = f"sk_{secrets.token_hex(2)}"
         self.data = {"name": "", "id": "", "description": "", "template": "empty"}
 
     def compose(self) -> ComposeResult:
@@ -170,23 +237,15 @@ class CreateSkillWizard(ModalScreen):
 
         skill_dir = skills_dir / self.data["id"]
 
-        # Check if skill already exists
-        if skill_dir.exists():
-            self.app.notify(
-                f"Skill '{self.data['id']}' already exists", severity="error"
-            )
-            return
-
         try:
-            # Create skill directory
-            skill_dir.mkdir(parents=True, exist_ok=True)
+            # Create skill directory - fails if the skill already exists
+            skill_dir.mkdir()
 
             # Generate SKILL.md content based on template
             template_content = self._get_template_content()
 
             skill_file = skill_dir / "SKILL.md"
-            with open(skill_file, "w") as f:
-                f.write(template_content)
+            create_exclusive(skill_file, template_content)
 
             self.app.notify(f"Created skill: {self.data['name']} ({self.data['id']})")
             self.app.pop_screen()
@@ -201,94 +260,20 @@ class CreateSkillWizard(ModalScreen):
         except OSError as e:
             self.app.notify(f"Failed to create skill: {e}", severity="error")
 
-    def _get_template_content(self) -> str:
-        """Generate SKILL.md content based on template."""
+    def _get_template_content(self) -> bytes:
+        """Generate UTF-8 encoded SKILL.md content based on template."""
         template = self.data["template"]
 
-        base_frontmatter = f"""---
+        header = f"""---
 name: {self.data["name"]}
 description: {self.data["description"]}
 ---
 
-"""
-
-        if template == "api":
-            return (
-                base_frontmatter
-                + """# API Integration Skill
-
-This skill provides integration with external APIs.
-
-## Usage
-
-```python
-from your_module import make_api_call
-
-result = make_api_call(endpoint, data)
-```
-
-## Configuration
-
-Add API credentials to your ~/.claude/settings.json:
+""".encode("utf-8")
 
-```json
-{
-  "env": {
-    "API_KEY": "your-api-key"
-  }
-}
-```
-"""
-            )
-        elif template == "data":
-            return (
-                base_frontmatter
-                + """# Data Processing Skill
-
-This skill provides data transformation and processing capabilities.
-
-## Usage
-
-```python
-from your_module import process_data
-
-result = process_data(input_data)
-```
-
-## Features
-
-- Data validation
-- Format conversion
-- Batch processing
-"""
-            )
-        elif template == "utility":
-            return (
-                base_frontmatter
-                + """# Utility Skill
-
-This skill provides various utility functions.
-
-## Usage
-
-Import and use the functions as needed:
-
-```python
-from your_module import utility_function
-
-result = utility_function(args)
-```
-
-## Functions
-
-- `function1()` - Description
-- `function2()` - Description
-"""
-            )
-        else:  # empty
-            return (
-                base_frontmatter
-                + """# {name}
+        body = _TEMPLATE_BODIES.get(template)
+        if body is None:  # empty
+            body = """# {name}
 
 This is a custom skill for Claude Code.
 
@@ -299,5 +284,6 @@ Add your skill description here.
 ## Usage
 
 Explain how to use this skill.
-""".format(name=self.data["name"])
-            )
+""".format(name=self.data["name"]).encode("utf-8")
+
+        return header + body
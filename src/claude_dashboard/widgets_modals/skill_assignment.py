@@ -33,6 +33,8 @@ class SkillAssignmentModal(ModalScreen):
         self.agent_id = agent_id
         self.enabled_skills = enabled_skills or set()
         self.agent_path = agent_path
+        # (skill_id, checkbox) pairs, filled in by compose()
+        self._checkboxes: list[tuple[str, Checkbox]] = []
 
     def compose(self) -> ComposeResult:
         with Vertical(id="modal_container"):
@@ -44,17 +46,22 @@ class SkillAssignmentModal(ModalScreen):
             config = ClaudeConfig()
             skills = config.get_skills()
 
+            # Build (id, label, checked) rows up front, then mount in one pass
+            rows = [
+                (
+                    skill["id"],
+                    f"{skill['id']:<20} ({skill.get('description', '')[:40]})",
+                    skill["id"] in self.enabled_skills,
+                )
+                for skill in skills
+            ]
+
+            self._checkboxes = []
             with ScrollableContainer(id="skills_list"):
-                for skill in skills:
-                    skill_id = skill["id"]
-                    description = skill.get("description", "")[:40]
-                    is_checked = skill_id in self.enabled_skills
-
-                    yield Checkbox(
-                        label=f"{skill_id:20} ({description})",
-                        value=is_checked,
-                        id=f"skill_{skill_id}"
-                    )
+                for skill_id, label, is_checked in rows:
+                    checkbox = Checkbox(label=label, value=is_checked, id=f"skill_{skill_id}")
+                    self._checkboxes.append((skill_id, checkbox))
+                    yield checkbox
 
             yield Label("")  # spacer
             with Horizontal():
@@ -74,11 +81,7 @@ class SkillAssignmentModal(ModalScreen):
             return
 
         # Collect selected skill IDs
-        selected_skills = []
-        for checkbox in self.query(Checkbox):
-            if checkbox.value:
-                skill_id = checkbox.id.replace("skill_", "")
-                selected_skills.append(skill_id)
+        selected_skills = [skill_id for skill_id, checkbox in self._checkboxes if checkbox.value]
 
         try:
             # Read current agent file
@@ -90,7 +93,7 @@ class SkillAssignmentModal(ModalScreen):
             updated_content = update_frontmatter(content, {"skills": selected_skills})
 
             # Write back to file
-            agent_file.write_text(updated_content)
+            agent_file.write_bytes(updated_content.encode("utf-8"))
 
             self.app.notify(f"Assigned {len(selected_skills)} skills to {self.agent_id}")
             self.app.pop_screen()
@@ -1,7 +1,10 @@
+import threading
 import pytest
 from pathlib import Path
-from unittest.mock import patch
-from claude_dashboard.config.claude_config import ClaudeConfig
+from unittest.mock import Mock, patch
+from watchdog.events import FileDeletedEvent, FileModifiedEvent, FileMovedEvent
+from claude_dashboard.config import claude_config
+from claude_dashboard.config.claude_config import ClaudeConfig, ConfigWatcher
 
 
 @pytest.fixture(autouse=True)
@@ -81,6 +84,216 @@ def test_singleton_allows_same_claude_dir(mock_claude_dir):
     assert config1 is config2
 
 
+def test_get_agents_reuses_parsed_metadata_for_unchanged_files(mock_claude_dir):
+    """Test that unchanged files are not re-read after the list cache is invalidated."""
+    config = ClaudeConfig(claude_dir=mock_claude_dir)
+    config.get_agents()
+    config.invalidate_cache()
+
+    with patch.object(claude_config, '_read_header', side_effect=AssertionError("re-read")):
+        agents = config.get_agents()
+
+    assert agents[0]["name"] == "architect"
+
+
+def test_get_agents_results_do_not_alias_cached_metadata(mock_claude_dir):
+    """Test that modifying a returned agent doesn't change the metadata cache."""
+    config = ClaudeConfig(claude_dir=mock_claude_dir)
+    config.get_agents()[0]["name"] = "changed"
+
+    config.invalidate_cache()
+    assert config.get_agents()[0]["name"] == "architect"
+
+
+def test_get_agents_reparses_modified_files(mock_claude_dir):
+    """Test that a file whose mtime/size changed is parsed again."""
+    config = ClaudeConfig(claude_dir=mock_claude_dir)
+    config.get_agents()
+
+    (mock_claude_dir / "agents" / "architect.md").write_text("""---
+name: architect
+description: Updated description
+---
+Body content""")
+    config.invalidate_cache()
+
+    agents = config.get_agents()
+    assert agents[0]["description"] == "Updated description"
+
+
+def test_get_agents_reads_frontmatter_longer_than_header_chunk(mock_claude_dir):
+    """Test that frontmatter extending past the first read chunk is still parsed."""
+    long_description = "x" * (claude_config.HEADER_READ_SIZE * 2)
+    (mock_claude_dir / "agents" / "verbose.md").write_text(
+        f"---\nname: verbose\ndescription: {long_description}\n---\nBody"
+    )
+
+    config = ClaudeConfig(claude_dir=mock_claude_dir)
+    agents = {a["id"]: a for a in config.get_agents()}
+
+    assert agents["verbose"]["description"] == long_description
+    assert agents["verbose"]["content"] == "Body"
+
+
+def test_get_agents_tolerates_multibyte_char_at_chunk_boundary(mock_claude_dir):
+    """Test that a UTF-8 sequence split by the bounded read isn't a decode error."""
+    header = "---\nname: big\n---\n"
+    padding = "a" * (claude_config.HEADER_READ_SIZE - len(header) - 1)
+    (mock_claude_dir / "agents" / "big.md").write_text(
+        header + padding + "é" * 100, encoding="utf-8"
+    )
+
+    config = ClaudeConfig(claude_dir=mock_claude_dir)
+    agents = {a["id"]: a for a in config.get_agents()}
+
+    assert agents["big"]["name"] == "big"
+    # The body was cut off by the bounded read, so no fragment is cached
+    assert agents["big"]["content"] is None
+
+
+def test_get_agents_parses_many_files_in_parallel(mock_claude_dir):
+    """Test that the thread-pool path returns every readable agent."""
+    agents_dir = mock_claude_dir / "agents"
+    for i in range(claude_config.PARALLEL_PARSE_MIN + 2):
+        (agents_dir / f"agent{i}.md").write_text(f"---\nname: agent{i}\n---\nBody")
+
+    config = ClaudeConfig(claude_dir=mock_claude_dir)
+
+    original_read_header = claude_config._read_header
+    def mock_read_header(path):
+        if Path(path).name == "agent0.md":
+            raise PermissionError(f"Permission denied: {path}")
+        return original_read_header(path)
+
+    with patch.object(claude_config, '_read_header', mock_read_header):
+        agents = config.get_agents()
+
+    names = {a["id"]: a["name"] for a in agents}
+    assert "agent0" not in names
+    assert names["agent1"] == "agent1"
+    assert len(names) == claude_config.PARALLEL_PARSE_MIN + 2
+
+
+def test_metadata_cache_persists_across_instances(mock_claude_dir):
+    """Test that a new ClaudeConfig reuses the on-disk metadata cache."""
+    ClaudeConfig(claude_dir=mock_claude_dir).get_agents()
+    assert (mock_claude_dir / claude_config.CACHE_FILE_NAME).exists()
+
+    ClaudeConfig._instance = None
+    config = ClaudeConfig(claude_dir=mock_claude_dir)
+
+    with patch.object(claude_config, '_read_header', side_effect=AssertionError("re-read")):
+        agents = config.get_agents()
+
+    assert agents[0]["name"] == "architect"
+
+
+def test_corrupted_metadata_cache_is_ignored(mock_claude_dir):
+    """Test that an unreadable cache file falls back to parsing the files."""
+    (mock_claude_dir / claude_config.CACHE_FILE_NAME).write_text("{not json")
+
+    config = ClaudeConfig(claude_dir=mock_claude_dir)
+    agents = config.get_agents()
+
+    assert agents[0]["name"] == "architect"
+
+
+def test_update_one_invalidates_only_the_affected_list(mock_claude_dir):
+    """Test that a file event refreshes its own list without touching others."""
+    config = ClaudeConfig(claude_dir=mock_claude_dir)
+    config.get_agents()
+    skills = config.get_skills()
+
+    agent_file = mock_claude_dir / "agents" / "architect.md"
+    agent_file.unlink()
+    config._update_one(str(agent_file))
+
+    assert config.get_agents() == []
+    assert config.get_skills() is skills
+
+
+def test_update_one_from_another_thread_during_scans(mock_claude_dir):
+    """Test that watcher-thread invalidations don't break concurrent scans."""
+    agents_dir = mock_claude_dir / "agents"
+    for i in range(50):
+        (agents_dir / f"agent{i}.md").write_text(f"---\nname: agent{i}\n---\nBody")
+    paths = [str(path) for path in agents_dir.iterdir()]
+    config = ClaudeConfig(claude_dir=mock_claude_dir)
+    errors = []
+    done = threading.Event()
+
+    def invalidate():
+        try:
+            while not done.is_set():
+                for path in paths:
+                    config._update_one(path)
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=invalidate)
+    thread.start()
+    try:
+        for _ in range(50):
+            assert len(config.get_agents()) == 51
+    finally:
+        done.set()
+        thread.join()
+    assert errors == []
+
+
+def test_concurrent_cold_scans_of_agents_and_skills(mock_claude_dir):
+    """Test that scanning agents and skills on two threads at once is safe."""
+    for i in range(300):
+        (mock_claude_dir / "agents" / f"agent{i}.md").write_text(
+            f"---\nname: agent{i}\n---\nBody"
+        )
+        skill_dir = mock_claude_dir / "skills" / f"skill{i}"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text(f"---\nname: skill{i}\n---\nBody")
+    config = ClaudeConfig(claude_dir=mock_claude_dir)
+    errors = []
+
+    def scan(load):
+        try:
+            # Repeated cold scans widen the window for the threads to overlap
+            for _ in range(30):
+                config.invalidate_cache()
+                with config._meta_lock:
+                    config._meta_cache.clear()
+                assert len(load()) == 301
+        except Exception as e:
+            errors.append(e)
+
+    threads = [
+        threading.Thread(target=scan, args=(config.get_agents,)),
+        threading.Thread(target=scan, args=(config.get_skills,)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+def test_config_watcher_reports_moves_and_ignores_cache_file(mock_claude_dir):
+    """Test that atomic-save renames are reported and the cache file is ignored."""
+    changed = Mock()
+    watcher = ConfigWatcher(Mock(), debounce_seconds=60, on_path_changed=changed)
+    agents_dir = mock_claude_dir / "agents"
+
+    try:
+        watcher.on_moved(FileMovedEvent(str(agents_dir / "a.md.tmp"), str(agents_dir / "a.md")))
+        watcher.on_deleted(FileDeletedEvent(str(agents_dir / "b.md")))
+        watcher.on_modified(FileModifiedEvent(str(mock_claude_dir / claude_config.CACHE_FILE_NAME)))
+    finally:
+        watcher.stop()
+
+    assert [call.args[0] for call in changed.call_args_list] == [
+        str(agents_dir / "a.md"),
+        str(agents_dir / "b.md"),
+    ]
+
+
 def test_get_agents_handles_permission_error(mock_claude_dir):
     """Test that get_agents gracefully handles PermissionError."""
     agents_dir = mock_claude_dir / "agents"
@@ -91,14 +304,14 @@ def test_get_agents_handles_permission_error(mock_claude_dir):
 
     config = ClaudeConfig(claude_dir=mock_claude_dir)
 
-    # Mock read_text to raise PermissionError for the unreadable file
-    original_read_text = Path.read_text
-    def mock_read_text(self):
-        if self.name == "unreadable.md":
-            raise PermissionError(f"Permission denied: {self}")
-        return original_read_text(self)
+    # Mock _read_header to raise PermissionError for the unreadable file
+    original_read_header = claude_config._read_header
+    def mock_read_header(path):
+        if Path(path).name == "unreadable.md":
+            raise PermissionError(f"Permission denied: {path}")
+        return original_read_header(path)
 
-    with patch.object(Path, 'read_text', mock_read_text):
+    with patch.object(claude_config, '_read_header', mock_read_header):
         agents = config.get_agents()
 
     # Should return only the architect agent from the fixture, not crash
@@ -116,14 +329,14 @@ def test_get_agents_handles_unicode_decode_error(mock_claude_dir):
 
     config = ClaudeConfig(claude_dir=mock_claude_dir)
 
-    # Mock read_text to raise UnicodeDecodeError
-    original_read_text = Path.read_text
-    def mock_read_text(self):
-        if self.name == "bad_encoding.md":
+    # Mock _read_header to raise UnicodeDecodeError
+    original_read_header = claude_config._read_header
+    def mock_read_header(path):
+        if Path(path).name == "bad_encoding.md":
             raise UnicodeDecodeError('utf-8', b'\x80', 0, 1, 'invalid start byte')
-        return original_read_text(self)
+        return original_read_header(path)
 
-    with patch.object(Path, 'read_text', mock_read_text):
+    with patch.object(claude_config, '_read_header', mock_read_header):
         agents = config.get_agents()
 
     # Should return only the architect agent from the fixture, not crash
@@ -141,14 +354,14 @@ def test_get_agents_handles_os_error(mock_claude_dir):
 
     config = ClaudeConfig(claude_dir=mock_claude_dir)
 
-    # Mock read_text to raise OSError
-    original_read_text = Path.read_text
-    def mock_read_text(self):
-        if self.name == "error.md":
-            raise OSError(f"I/O error: {self}")
-        return original_read_text(self)
+    # Mock _read_header to raise OSError
+    original_read_header = claude_config._read_header
+    def mock_read_header(path):
+        if Path(path).name == "error.md":
+            raise OSError(f"I/O error: {path}")
+        return original_read_header(path)
 
-    with patch.object(Path, 'read_text', mock_read_text):
+    with patch.object(claude_config, '_read_header', mock_read_header):
         agents = config.get_agents()
 
     # Should return only the architect agent from the fixture, not crash
@@ -167,14 +380,14 @@ def test_get_skills_handles_permission_error(mock_claude_dir):
 
     config = ClaudeConfig(claude_dir=mock_claude_dir)
 
-    # Mock read_text to raise PermissionError for the bad skill
-    original_read_text = Path.read_text
-    def mock_read_text(self):
-        if self.parent.name == "bad_skill":
-            raise PermissionError(f"Permission denied: {self}")
-        return original_read_text(self)
+    # Mock _read_header to raise PermissionError for the bad skill
+    original_read_header = claude_config._read_header
+    def mock_read_header(path):
+        if Path(path).parent.name == "bad_skill":
+            raise PermissionError(f"Permission denied: {path}")
+        return original_read_header(path)
 
-    with patch.object(Path, 'read_text', mock_read_text):
+    with patch.object(claude_config, '_read_header', mock_read_header):
         skills = config.get_skills()
 
     # Should return only the brainstorming skill from the fixture, not crash
@@ -193,14 +406,14 @@ def test_get_skills_handles_unicode_decode_error(mock_claude_dir):
 
     config = ClaudeConfig(claude_dir=mock_claude_dir)
 
-    # Mock read_text to raise UnicodeDecodeError
-    original_read_text = Path.read_text
-    def mock_read_text(self):
-        if self.parent.name == "bad_skill":
+    # Mock _read_header to raise UnicodeDecodeError
+    original_read_header = claude_config._read_header
+    def mock_read_header(path):
+        if Path(path).parent.name == "bad_skill":
             raise UnicodeDecodeError('utf-8', b'\x80', 0, 1, 'invalid start byte')
-        return original_read_text(self)
+        return original_read_header(path)
 
-    with patch.object(Path, 'read_text', mock_read_text):
+    with patch.object(claude_config, '_read_header', mock_read_header):
         skills = config.get_skills()
 
     # Should return only the brainstorming skill from the fixture, not crash
@@ -219,14 +432,14 @@ def test_get_skills_handles_os_error(mock_claude_dir):
 
     config = ClaudeConfig(claude_dir=mock_claude_dir)
 
-    # Mock read_text to raise OSError
-    original_read_text = Path.read_text
-    def mock_read_text(self):
-        if self.parent.name == "bad_skill":
-            raise OSError(f"I/O error: {self}")
-        return original_read_text(self)
+    # Mock _read_header to raise OSError
+    original_read_header = claude_config._read_header
+    def mock_read_header(path):
+        if Path(path).parent.name == "bad_skill":
+            raise OSError(f"I/O error: {path}")
+        return original_read_header(path)
 
-    with patch.object(Path, 'read_text', mock_read_text):
+    with patch.object(claude_config, '_read_header', mock_read_header):
         skills = config.get_skills()
 
     # Should return only the brainstorming skill from the fixture, not crash
@@ -254,15 +467,21 @@ def test_get_settings_masks_sensitive_values(mock_claude_dir):
     """Test that get_settings masks API keys and tokens."""
     # Create a valid settings.json with sensitive values
     settings_file = mock_claude_dir / "settings.json"
-    settings_file.write_text('{"env": {"API_KEY": "secret123", "NORMAL_VAR": "value"}}')
+    settings_file.write_text(
+        '{"env": {"API_KEY": "secret123", "db_password": "hunter2", '
+        '"HTTP_AUTHORIZATION": "Bearer x", "GIT_AUTHOR_NAME": "Ada", "NORMAL_VAR": "value"}}'
+    )
 
     config = ClaudeConfig(claude_dir=mock_claude_dir)
     settings = config.get_settings()
 
-    # API key should be masked
+    # API key and password should be masked, regardless of case
     assert settings["env"]["API_KEY"] == "••••••••"
-    # Normal variable should not be masked
+    assert settings["env"]["db_password"] == "••••••••"
+    assert settings["env"]["HTTP_AUTHORIZATION"] == "••••••••"
+    # Normal variables, including AUTHOR ones, should not be masked
     assert settings["env"]["NORMAL_VAR"] == "value"
+    assert settings["env"]["GIT_AUTHOR_NAME"] == "Ada"
 
 
 def test_get_settings_returns_empty_dict_when_missing(mock_claude_dir):
@@ -272,3 +491,16 @@ def test_get_settings_returns_empty_dict_when_missing(mock_claude_dir):
 
     # Should return empty dict
     assert settings == {}
+
+
+def test_get_settings_reuses_parse_until_file_changes(mock_claude_dir):
+    """Test that settings.json is only re-read after it changes."""
+    settings_file = mock_claude_dir / "settings.json"
+    settings_file.write_text('{"theme": "dark"}')
+
+    config = ClaudeConfig(claude_dir=mock_claude_dir)
+    first = config.get_settings()
+    assert config.get_settings() is first
+
+    settings_file.write_text('{"theme": "light", "verbose": true}')
+    assert config.get_settings() == {"theme": "light", "verbose": True}
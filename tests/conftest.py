@@ -0,0 +1,9 @@
+"""Shared pytest configuration for the Claude Dashboard tests."""
+
+# Import the modules most test files use once, up front, so collecting each
+# test module only looks them up in sys.modules
+import claude_dashboard.app  # noqa: F401
+import claude_dashboard.screens.shortcuts_help  # noqa: F401
+import claude_dashboard.utils.editor  # noqa: F401
+import claude_dashboard.utils.frontmatter  # noqa: F401
+import claude_dashboard.widgets.line_numbers  # noqa: F401
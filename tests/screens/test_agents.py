@@ -1,9 +1,11 @@
 """Tests for Agents screen."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 from pathlib import Path
 from claude_dashboard.screens.agents import AgentDetailScreen
+from claude_dashboard.screens.editor import EditorScreen
 from claude_dashboard.config.claude_config import ClaudeConfig
 
 
@@ -20,9 +22,20 @@ def agent_data():
     }
 
 
-@patch('claude_dashboard.screens.agents.open_editor')
-def test_agent_detail_screen_edit_button_uses_suspend_not_exit(mock_open_editor, agent_data, tmp_path):
-    """Test that edit button uses app.suspend() instead of app.exit()."""
+@pytest.fixture
+def mock_app():
+    """Create a lightweight stand-in for the app with mock methods."""
+    return SimpleNamespace(
+        pop_screen=Mock(),
+        push_screen=Mock(),
+        suspend=Mock(),
+        exit=Mock(),
+        notify=Mock(),
+    )
+
+
+def test_agent_detail_screen_edit_button_opens_editor_screen(agent_data, tmp_path, mock_app):
+    """Test that edit button replaces the modal with the inline EditorScreen."""
     # Create a temporary file for the agent
     agent_file = tmp_path / "test_agent.py"
     agent_file.write_text("# Test agent content")
@@ -31,12 +44,6 @@ def test_agent_detail_screen_edit_button_uses_suspend_not_exit(mock_open_editor,
     # Create the screen with a mocked app
     screen = AgentDetailScreen(agent_data)
 
-    # Mock the app property
-    mock_app = MagicMock()
-    mock_app.pop_screen = Mock()
-    mock_app.suspend = Mock()
-    mock_app.exit = Mock()
-
     with patch.object(type(screen), 'app', new_callable=lambda: property(lambda self: mock_app)):
         # Create a mock button press event for edit button (no id = edit button)
         mock_button = Mock()
@@ -50,25 +57,22 @@ def test_agent_detail_screen_edit_button_uses_suspend_not_exit(mock_open_editor,
         # Verify that pop_screen was called to close the modal
         mock_app.pop_screen.assert_called_once()
 
-        # Verify that app.suspend() was called (NOT app.exit())
-        mock_app.suspend.assert_called_once()
-        mock_app.exit.assert_not_called()
+        # Verify that the editor was pushed for the agent's file
+        mock_app.push_screen.assert_called_once()
+        editor = mock_app.push_screen.call_args.args[0]
+        assert isinstance(editor, EditorScreen)
+        assert editor.file_path == agent_file
+        assert editor.original_content == "# Test agent content"
 
-        # Verify open_editor was called with the correct path
-        mock_open_editor.assert_called_once_with(str(agent_file))
+        # The app is neither suspended nor exited
+        mock_app.suspend.assert_not_called()
+        mock_app.exit.assert_not_called()
 
 
-@patch('claude_dashboard.screens.agents.open_editor')
-def test_agent_detail_screen_close_button_pops_screen(mock_open_editor, agent_data):
+def test_agent_detail_screen_close_button_pops_screen(agent_data, mock_app):
     """Test that close button pops the screen."""
     screen = AgentDetailScreen(agent_data)
 
-    # Mock the app property
-    mock_app = MagicMock()
-    mock_app.pop_screen = Mock()
-    mock_app.suspend = Mock()
-    mock_app.exit = Mock()
-
     with patch.object(type(screen), 'app', new_callable=lambda: property(lambda self: mock_app)):
         # Create a mock button press event for close button
         mock_button = Mock()
@@ -82,15 +86,13 @@ def test_agent_detail_screen_close_button_pops_screen(mock_open_editor, agent_da
         # Verify that pop_screen was called
         mock_app.pop_screen.assert_called_once()
 
-        # Verify that suspend was NOT called (it's the close button)
+        # Verify that no editor was opened (it's the close button)
+        mock_app.push_screen.assert_not_called()
         mock_app.suspend.assert_not_called()
         mock_app.exit.assert_not_called()
 
-        # Verify open_editor was NOT called
-        mock_open_editor.assert_not_called()
-
 
-def test_agent_detail_screen_edit_button_without_path_shows_error(agent_data):
+def test_agent_detail_screen_edit_button_without_path_shows_error(agent_data, mock_app):
     """Test that edit button without path shows error notification."""
     # Remove path from agent data
     agent_data_without_path = agent_data.copy()
@@ -98,13 +100,6 @@ def test_agent_detail_screen_edit_button_without_path_shows_error(agent_data):
 
     screen = AgentDetailScreen(agent_data_without_path)
 
-    # Mock the app property
-    mock_app = MagicMock()
-    mock_app.pop_screen = Mock()
-    mock_app.suspend = Mock()
-    mock_app.exit = Mock()
-    mock_app.notify = Mock()
-
     with patch.object(type(screen), 'app', new_callable=lambda: property(lambda self: mock_app)):
         # Create a mock button press event for edit button
         mock_button = Mock()
@@ -125,3 +120,14 @@ def test_agent_detail_screen_edit_button_without_path_shows_error(agent_data):
         mock_app.pop_screen.assert_not_called()
         mock_app.suspend.assert_not_called()
         mock_app.exit.assert_not_called()
+
+
+def test_agent_detail_screen_reads_body_when_content_was_not_cached(agent_data, tmp_path):
+    """Test that a body cut off by the header read is loaded from the file."""
+    agent_file = tmp_path / "long_agent.md"
+    agent_file.write_text("---\nname: long\n---\nFull body text")
+    agent_data.update(path=str(agent_file), content=None)
+
+    screen = AgentDetailScreen(agent_data)
+
+    assert screen._content() == "Full body text"
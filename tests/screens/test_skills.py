@@ -1,8 +1,12 @@
 """Tests for Skills screen."""
 
+import asyncio
 import pytest
 from unittest.mock import Mock, patch, MagicMock
+from textual.app import App
 from textual.widgets import Input, DataTable
+from claude_dashboard.config.claude_config import ClaudeConfig
+from claude_dashboard.screens.agents import AgentsScreen
 from claude_dashboard.screens.skills import SkillsScreen
 
 
@@ -179,3 +183,83 @@ def test_on_mount_sets_skills_attribute(mock_config_class, mock_skills):
     # The screen should have a skills attribute after on_mount would be called
     # For this test, we just verify the config would be called
     mock_config.get_skills.assert_not_called()  # Not called yet
+
+
+def _mount_skills_screen(remount=False):
+    """Mount a SkillsScreen, wait for its loader worker and return the table state."""
+    class SkillsApp(App):
+        def compose(self):
+            yield SkillsScreen()
+
+    async def run():
+        app = SkillsApp()
+        async with app.run_test() as pilot:
+            screen = app.query_one(SkillsScreen)
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            if remount:
+                screen.on_mount()
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+            table = screen.query_one("#skills_table", DataTable)
+            rows = [table.get_row_at(i) for i in range(table.row_count)]
+            return screen.skills, len(table.columns), rows
+
+    return asyncio.run(run())
+
+
+@patch('claude_dashboard.screens.skills.ClaudeConfig')
+def test_on_mount_loads_skills_into_table(mock_config_class, mock_skills):
+    """Test that the loader worker fills the table and re-mounting doesn't add columns."""
+    mock_config_class.return_value.get_skills.return_value = mock_skills
+
+    skills, column_count, rows = _mount_skills_screen(remount=True)
+
+    assert skills == mock_skills
+    assert column_count == 3
+    assert rows == [
+        ["test-driven-development", "Test Driven Development", "Write tests first, then code"],
+        ["brainstorming", "Brainstorming", "Explore ideas collaboratively"],
+        ["systematic-debugging", "Systematic Debugging", "Debug methodically"],
+    ]
+
+
+@patch('claude_dashboard.screens.skills.ClaudeConfig')
+def test_on_mount_shows_placeholder_without_skills(mock_config_class):
+    """Test that an empty skills directory shows a placeholder row."""
+    mock_config_class.return_value.get_skills.return_value = []
+
+    skills, _, rows = _mount_skills_screen()
+
+    assert skills == []
+    assert rows == [["", "No skills found", "Check ~/.claude/skills/"]]
+
+
+def test_skills_worker_and_agents_screen_load_concurrently(tmp_path, monkeypatch):
+    """Test that the skills worker and AgentsScreen can scan a cold cache at once."""
+    claude_dir = tmp_path / ".claude"
+    (claude_dir / "agents").mkdir(parents=True)
+    for i in range(200):
+        (claude_dir / "agents" / f"agent{i}.md").write_text(f"---\nname: agent{i}\n---\nBody")
+        skill_dir = claude_dir / "skills" / f"skill{i}"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(f"---\nname: skill{i}\n---\nBody")
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(ClaudeConfig, "_instance", None)
+
+    class BothScreensApp(App):
+        def compose(self):
+            # Skills first, so its worker is already scanning when the agents mount
+            yield SkillsScreen()
+            yield AgentsScreen()
+
+    async def run():
+        app = BothScreensApp()
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            skills_table = app.query_one("#skills_table", DataTable)
+            agents_table = app.query_one("#agents_table", DataTable)
+            return skills_table.row_count, agents_table.row_count
+
+    assert asyncio.run(run()) == (200, 200)
@@ -1,12 +1,19 @@
 """Tests for ClaudeDashboard app."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock
 from pathlib import Path
+from claude_dashboard import app as app_module
 from claude_dashboard.app import ClaudeDashboard
 from claude_dashboard.config.claude_config import ClaudeConfig
 from textual import events
 
+# ClaudeConfig's attribute names, computed once and used as a mock spec
+_CONFIG_SPEC = dir(ClaudeConfig)
+
+# Key events for the number shortcuts, one per sidebar item (1-7)
+_NUM_KEYS = tuple(events.Key(str(n), str(n)) for n in range(1, 8))
+
 
 @pytest.fixture
 def mock_claude_dir(tmp_path):
@@ -18,98 +25,103 @@ def mock_claude_dir(tmp_path):
     return tmp_path
 
 
-def test_on_unmount_stops_observer(mock_claude_dir):
-    """Test that on_unmount properly stops and joins the observer thread."""
-    # Create app with mocked ClaudeConfig
-    with patch("claude_dashboard.app.ClaudeConfig") as mock_config_class:
-        mock_config = Mock(spec=ClaudeConfig)
-        mock_config_class.return_value = mock_config
+@pytest.fixture(scope="module")
+def dashboard_app():
+    """Create one unmounted app shared by tests that don't change its state."""
+    return ClaudeDashboard()
+
+
+@pytest.fixture
+def patch_claude_config(monkeypatch):
+    """Replace ClaudeConfig in the app module and return the mock instance."""
+    mock_config = Mock(spec=_CONFIG_SPEC)
+    monkeypatch.setattr(app_module, "ClaudeConfig", Mock(return_value=mock_config))
+    return mock_config
 
-        # Create a mock observer
+
+@pytest.fixture
+def mounted_app(patch_claude_config):
+    """Return a factory that mounts an app whose observer reports is_alive."""
+    def build(is_alive=True):
         mock_observer = Mock()
-        mock_observer.is_alive.return_value = True
-        mock_config.start_watching.return_value = mock_observer
+        mock_observer.is_alive.return_value = is_alive
+        patch_claude_config.start_watching.return_value = mock_observer
 
-        # Create and mount the app
         app = ClaudeDashboard()
         app.on_mount()
+        return app, mock_observer
 
-        # Verify observer was started
-        assert hasattr(app, "_observer")
-        assert app._observer is not None
+    return build
 
-        # Unmount the app
-        app.on_unmount()
 
-        # Verify observer was stopped and joined with timeout
-        mock_observer.stop.assert_called_once()
-        mock_observer.join.assert_called_once_with(timeout=5.0)
+def test_on_unmount_stops_observer(mock_claude_dir, mounted_app):
+    """Test that on_unmount properly stops and joins the observer thread."""
+    app, mock_observer = mounted_app(is_alive=True)
 
+    # Verify observer was started
+    assert hasattr(app, "_observer")
+    assert app._observer is not None
 
-def test_on_unmount_handles_no_observer():
-    """Test that on_unmount handles case where observer doesn't exist."""
-    app = ClaudeDashboard()
+    # Unmount the app
+    app.on_unmount()
 
+    # Verify observer was stopped and joined with timeout
+    mock_observer.stop.assert_called_once()
+    mock_observer.join.assert_called_once_with(timeout=5.0)
+
+
+def test_on_unmount_handles_no_observer(dashboard_app):
+    """Test that on_unmount handles case where observer doesn't exist."""
     # Should not raise exception even if _observer doesn't exist
-    app.on_unmount()
+    dashboard_app.on_unmount()
 
 
-def test_on_unmount_handles_dead_observer(mock_claude_dir):
+def test_on_unmount_handles_dead_observer(mock_claude_dir, mounted_app):
     """Test that on_unmount handles case where observer is already dead."""
-    with patch("claude_dashboard.app.ClaudeConfig") as mock_config_class:
-        mock_config = Mock(spec=ClaudeConfig)
-        mock_config_class.return_value = mock_config
+    app, mock_observer = mounted_app(is_alive=False)
 
-        # Create a mock observer that is not alive
-        mock_observer = Mock()
-        mock_observer.is_alive.return_value = False
-        mock_config.start_watching.return_value = mock_observer
+    # Unmount should not try to stop a dead observer
+    app.on_unmount()
 
-        app = ClaudeDashboard()
-        app.on_mount()
+    # stop and join should not be called
+    mock_observer.stop.assert_not_called()
+    mock_observer.join.assert_not_called()
 
-        # Unmount should not try to stop a dead observer
-        app.on_unmount()
 
-        # stop and join should not be called
-        mock_observer.stop.assert_not_called()
-        mock_observer.join.assert_not_called()
+def test_app_has_jump_action(dashboard_app):
+    """Test that action_jump method exists (replaces _jump_to_sidebar_item)."""
+    assert hasattr(dashboard_app, "action_jump"), "App should have action_jump method"
 
 
 def test_number_key_shortcuts_navigate_to_screens():
     """Test that number keys 1-7 navigate to corresponding sidebar screens."""
     app = ClaudeDashboard()
 
-    # Test that action_jump method exists (replaces _jump_to_sidebar_item)
-    assert hasattr(app, "action_jump"), "App should have action_jump method"
-
     # Test that number keys trigger the jump method
     # We'll mock the query_one to avoid full app initialization
-    with patch.object(app, "query_one") as mock_query:
-        mock_content_area = MagicMock()
-        mock_query.return_value = mock_content_area
+    mock_content_area = Mock(children=[])
+    mock_query = app.query_one = Mock(return_value=mock_content_area)
 
-        # Test each number key (1-7 for 7 sidebar items)
-        for number in range(1, 8):
-            key_event = events.Key(str(number), str(number))
-            app.on_key(key_event)
+    # Test each number key (1-7 for 7 sidebar items)
+    for key_event in _NUM_KEYS:
+        app.on_key(key_event)
 
-            # Verify query_one was called (method is working)
-            mock_query.assert_called()
+        # Verify query_one was called (method is working)
+        mock_query.assert_called()
 
-        # Reset mock for invalid key tests
-        mock_query.reset_mock()
+    # Reset mock for invalid key tests
+    mock_query.reset_mock()
 
-        # Test invalid number keys do nothing
-        initial_call_count = mock_query.call_count
+    # Test invalid number keys do nothing
+    initial_call_count = mock_query.call_count
 
-        key_event = events.Key("9", "9")
-        app.on_key(key_event)
+    key_event = events.Key("9", "9")
+    app.on_key(key_event)
 
-        # For "9" (out of range), query_one should still be called but the logic handles it gracefully
-        # The method checks bounds so it won't crash
+    # For "9" (out of range), query_one should still be called but the logic handles it gracefully
+    # The method checks bounds so it won't crash
 
-        key_event = events.Key("0", "0")
-        app.on_key(key_event)
+    key_event = events.Key("0", "0")
+    app.on_key(key_event)
 
-        # For "0" (invalid), same behavior - no crash
+    # For "0" (invalid), same behavior - no crash
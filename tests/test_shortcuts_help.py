@@ -1,9 +1,20 @@
 """Tests for ShortcutsHelpScreen."""
 
 import pytest
+from textual.screen import ModalScreen
 from claude_dashboard.screens.shortcuts_help import ShortcutsHelpScreen
 
 
+@pytest.fixture(scope="session")
+def all_shortcut_keys():
+    """Collect the keys of every shortcut across all categories."""
+    return frozenset(
+        key
+        for shortcut_list in ShortcutsHelpScreen.SHORTCUTS.values()
+        for key, _ in shortcut_list
+    )
+
+
 def test_shortcuts_help_shortcuts_dict():
     """Test that SHORTCUTS dict has expected structure."""
     shortcuts = ShortcutsHelpScreen.SHORTCUTS
@@ -24,49 +35,24 @@ def test_shortcuts_help_shortcuts_dict():
             assert isinstance(desc, str)
 
 
-def test_shortcuts_help_css_defined():
-    """Test that CSS is properly defined."""
-    screen = ShortcutsHelpScreen()
-    assert screen.CSS is not None
-    assert "ShortcutsHelpScreen" in screen.CSS
-    assert "#help_container" in screen.CSS
-
-
-def test_shortcuts_help_expected_shortcuts():
-    """Test that expected shortcuts are defined."""
-    shortcuts = ShortcutsHelpScreen.SHORTCUTS
-
-    # Check for essential shortcuts
-    all_shortcuts = []
-    for category_shortcuts in shortcuts.values():
-        all_shortcuts.extend(category_shortcuts)
-
-    # Check that key shortcuts exist
-    shortcut_keys = [k for k, _ in all_shortcuts]
-    assert "?" in shortcut_keys  # Help shortcut
-    assert "Ctrl+P" in shortcut_keys  # Command palette
-    assert "Ctrl+S" in shortcut_keys  # Save
-    assert "Ctrl+Q" in shortcut_keys  # Quit
-
-
-def test_shortcuts_help_has_compose_method():
-    """Test that compose method exists."""
-    screen = ShortcutsHelpScreen()
-    assert hasattr(screen, 'compose')
-    assert callable(screen.compose)
+def test_shortcuts_help_class_structure():
+    """Test that the screen is a modal with CSS, compose and a button handler."""
+    assert issubclass(ShortcutsHelpScreen, ModalScreen)
 
+    assert ShortcutsHelpScreen.CSS is not None
+    assert "ShortcutsHelpScreen" in ShortcutsHelpScreen.CSS
+    assert "#help_container" in ShortcutsHelpScreen.CSS
 
-def test_shortcuts_help_has_button_handler():
-    """Test that button press handler is defined."""
-    screen = ShortcutsHelpScreen()
-    assert hasattr(screen, 'on_button_pressed')
-    assert callable(screen.on_button_pressed)
+    assert callable(getattr(ShortcutsHelpScreen, 'compose', None))
+    assert callable(getattr(ShortcutsHelpScreen, 'on_button_pressed', None))
 
 
-def test_shortcuts_help_screen_is_modal():
-    """Test that ShortcutsHelpScreen is a modal screen."""
-    from textual.screen import ModalScreen
-    assert issubclass(ShortcutsHelpScreen, ModalScreen)
+def test_shortcuts_help_expected_shortcuts(all_shortcut_keys):
+    """Test that expected shortcuts are defined."""
+    assert "?" in all_shortcut_keys  # Help shortcut
+    assert "Ctrl+P" in all_shortcut_keys  # Command palette
+    assert "Ctrl+S" in all_shortcut_keys  # Save
+    assert "Ctrl+Q" in all_shortcut_keys  # Quit
 
 
 def test_shortcuts_help_shortcuts_content():
@@ -2,12 +2,27 @@
 
 import logging
 from pathlib import Path
-from unittest.mock import patch
 import pytest
 
+from claude_dashboard.utils import editor
 from claude_dashboard.utils.editor import open_editor
 
 
+@pytest.fixture(scope="module")
+def existing_file(tmp_path_factory):
+    """Create one file for tests that only need open_editor's exists() check to pass."""
+    path = tmp_path_factory.mktemp("editor") / "test.txt"
+    path.write_text("content")
+    return path
+
+
+def _raising(exc):
+    """Return a _subprocess_call replacement that raises exc."""
+    def call(*args, **kwargs):
+        raise exc
+    return call
+
+
 class TestOpenEditorLogging:
     """Test that open_editor uses logging instead of print."""
 
@@ -18,42 +33,39 @@ class TestOpenEditorLogging:
         with caplog.at_level(logging.ERROR):
             open_editor(non_existent)
 
-        assert "File not found" in caplog.text
-        assert str(non_existent) in caplog.text
+        message = caplog.records[-1].getMessage()
+        assert "File not found" in message
+        assert str(non_existent) in message
 
-    def test_logs_warning_when_editor_exits_with_nonzero(self, tmp_path, caplog):
+    def test_logs_warning_when_editor_exits_with_nonzero(self, existing_file, caplog, monkeypatch):
         """Should log warning when editor exits with nonzero code."""
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("content")
+        monkeypatch.setattr(editor, "_subprocess_call", lambda *args, **kwargs: 1)
 
-        with patch("subprocess.call") as mock_call:
-            mock_call.return_value = 1
-            with caplog.at_level(logging.WARNING):
-                open_editor(test_file)
+        with caplog.at_level(logging.WARNING):
+            open_editor(existing_file)
 
-        assert "exited with code 1" in caplog.text
+        message = caplog.records[-1].getMessage()
+        assert "exited with code 1" in message
 
-    def test_logs_error_when_editor_not_found(self, tmp_path, caplog):
+    def test_logs_error_when_editor_not_found(self, existing_file, caplog, monkeypatch):
         """Should log error when editor executable is not found."""
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("content")
+        monkeypatch.setenv("EDITOR", "nonexistent_editor_xyz")
+        monkeypatch.setattr(editor, "_subprocess_call", _raising(FileNotFoundError))
 
-        with patch.dict("os.environ", {"EDITOR": "nonexistent_editor_xyz"}):
-            with patch("subprocess.call", side_effect=FileNotFoundError):
-                with caplog.at_level(logging.ERROR):
-                    open_editor(test_file)
+        with caplog.at_level(logging.ERROR):
+            open_editor(existing_file)
 
-        assert "not found" in caplog.text
-        assert "nonexistent_editor_xyz" in caplog.text
+        message = caplog.records[-1].getMessage()
+        assert "not found" in message
+        assert "nonexistent_editor_xyz" in message
 
-    def test_logs_error_on_generic_exception(self, tmp_path, caplog):
+    def test_logs_error_on_generic_exception(self, existing_file, caplog, monkeypatch):
         """Should log error on generic exception."""
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("content")
+        monkeypatch.setattr(editor, "_subprocess_call", _raising(RuntimeError("test error")))
 
-        with patch("subprocess.call", side_effect=RuntimeError("test error")):
-            with caplog.at_level(logging.ERROR):
-                open_editor(test_file)
+        with caplog.at_level(logging.ERROR):
+            open_editor(existing_file)
 
-        assert "Failed to open editor" in caplog.text
-        assert "test error" in caplog.text
+        message = caplog.records[-1].getMessage()
+        assert "Failed to open editor" in message
+        assert "test error" in message
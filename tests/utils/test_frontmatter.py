@@ -2,69 +2,83 @@ import pytest
 from claude_dashboard.utils.frontmatter import parse_frontmatter
 
 
-def test_parse_agent_with_frontmatter():
-    content = """---
-name: architect
-description: Design architecture
-model: opus
----
-This is the body content."""
-    result = parse_frontmatter(content)
-    assert result["name"] == "architect"
-    assert result["description"] == "Design architecture"
-    assert result["model"] == "opus"
-    assert result["content"] == "This is the body content."
+# (id, content, expected parse result)
+_CASES = [
+    (
+        "agent_with_frontmatter",
+        "---\nname: architect\ndescription: Design architecture\nmodel: opus\n---\n"
+        "This is the body content.",
+        {
+            "name": "architect",
+            "description": "Design architecture",
+            "model": "opus",
+            "content": "This is the body content.",
+        },
+    ),
+    (
+        "without_frontmatter",
+        "Just plain content",
+        {"content": "Just plain content"},
+    ),
+    (
+        "empty_frontmatter",
+        "---\n---\nBody only",
+        {"content": "Body only"},
+    ),
+    (
+        "windows_line_endings",
+        "---\r\nname: test\r\n---\r\nBody content",
+        {"name": "test", "content": "Body content"},
+    ),
+    (
+        "multiline_body",
+        "---\nname: test\n---\nLine 1\nLine 2\nLine 3",
+        {"name": "test", "content": "Line 1\nLine 2\nLine 3"},
+    ),
+    (
+        # Should fall back to content on YAML error
+        "malformed_yaml",
+        "---\nkey: value: invalid\n---\nBody",
+        {"content": "Body"},
+    ),
+    (
+        "empty_body_after_frontmatter",
+        "---\nname: test\n---\n",
+        {"name": "test", "content": ""},
+    ),
+    (
+        "flat_string_values_keep_inner_punctuation",
+        "---\nname: test\n"
+        "description: Handles URLs like https://example.com, commas and a:b pairs\n"
+        "---\nBody",
+        {
+            "name": "test",
+            "description": "Handles URLs like https://example.com, commas and a:b pairs",
+            "content": "Body",
+        },
+    ),
+    (
+        "typed_and_nested_values_use_yaml",
+        "---\nname: test\nenabled: true\nversion: 2\n"
+        "skills: [brainstorming, debugging]\n"
+        'description: "quoted: value"\n'
+        "---\nBody",
+        {
+            "name": "test",
+            "enabled": True,
+            "version": 2,
+            "skills": ["brainstorming", "debugging"],
+            "description": "quoted: value",
+            "content": "Body",
+        },
+    ),
+]
 
 
-def test_parse_file_without_frontmatter():
-    content = "Just plain content"
-    result = parse_frontmatter(content)
-    assert result["content"] == "Just plain content"
-    assert "name" not in result
-
-
-def test_parse_empty_frontmatter():
-    content = """---
----
-Body only"""
-    result = parse_frontmatter(content)
-    assert result["content"] == "Body only"
-
-
-def test_parse_with_windows_line_endings():
-    content = "---\r\nname: test\r\n---\r\nBody content"
-    result = parse_frontmatter(content)
-    assert result["name"] == "test"
-    assert result["content"] == "Body content"
-
-
-def test_parse_with_multiline_body():
-    content = """---
-name: test
----
-Line 1
-Line 2
-Line 3"""
-    result = parse_frontmatter(content)
-    assert result["name"] == "test"
-    assert result["content"] == "Line 1\nLine 2\nLine 3"
-
-
-def test_parse_with_malformed_yaml():
-    content = """---
-key: value: invalid
----
-Body"""
-    result = parse_frontmatter(content)
-    # Should fall back to content on YAML error
-    assert result["content"] == "Body"
-
-
-def test_parse_empty_body_after_frontmatter():
-    content = """---
-name: test
----
-"""
-    result = parse_frontmatter(content)
-    assert result["name"] == "test"
-    assert result["content"] == ""
+@pytest.mark.parametrize(
+    "content, expected",
+    [case[1:] for case in _CASES],
+    ids=[case[0] for case in _CASES],
+)
+def test_parse_frontmatter(content, expected):
+    assert parse_frontmatter(content) == expected
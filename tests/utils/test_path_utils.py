@@ -0,0 +1,25 @@
+"""Tests for path utility module."""
+
+import pytest
+
+from claude_dashboard.utils.path_utils import create_exclusive
+
+
+def test_create_exclusive_writes_new_file(tmp_path):
+    """Should create the file with the given bytes."""
+    target = tmp_path / "agent.md"
+
+    create_exclusive(target, "---\nname: café\n---\n".encode("utf-8"))
+
+    assert target.read_text(encoding="utf-8") == "---\nname: café\n---\n"
+
+
+def test_create_exclusive_refuses_existing_file(tmp_path):
+    """Should raise FileExistsError and leave an existing file untouched."""
+    target = tmp_path / "agent.md"
+    target.write_text("original")
+
+    with pytest.raises(FileExistsError):
+        create_exclusive(target, b"replacement")
+
+    assert target.read_text() == "original"
@@ -0,0 +1,58 @@
+"""Tests for search utility module."""
+
+import pytest
+
+from claude_dashboard.utils.search import SearchIndex
+
+
+@pytest.fixture
+def index():
+    return SearchIndex([
+        {"id": "test-driven-development", "name": "TDD", "description": "Write tests first"},
+        {"id": "brainstorming", "name": "Brainstorming", "description": "Explore ideas"},
+        {"id": "no-name", "description": None},
+    ])
+
+
+@pytest.mark.parametrize("term, expected_ids", [
+    ("test", ["test-driven-development"]),
+    ("brainstorm", ["brainstorming"]),
+    ("write", ["test-driven-development"]),
+    ("TEST", ["test-driven-development"]),
+    ("", ["test-driven-development", "brainstorming", "no-name"]),
+    ("nonexistent", []),
+])
+def test_filter_matches_id_name_and_description(index, term, expected_ids):
+    assert [item["id"] for item in index.filter(term)] == expected_ids
+
+
+def test_filter_does_not_match_across_fields(index):
+    """A term spanning the end of one field and the start of the next shouldn't match."""
+    assert index.filter("tddwrite") == []
+
+
+def test_filter_treats_regex_metacharacters_literally():
+    index = SearchIndex([
+        {"id": "c-plus-plus", "name": "C++", "description": "Uses (parens) and .dots"},
+        {"id": "plain", "name": "Plain", "description": "Nothing special"},
+    ])
+    assert [item["id"] for item in index.filter("c++")] == ["c-plus-plus"]
+    assert [item["id"] for item in index.filter("(parens)")] == ["c-plus-plus"]
+    assert index.filter(".*") == []
+
+
+def test_filter_results_do_not_depend_on_previous_terms(index):
+    """Typing, deleting and retyping should give the same results as a fresh search."""
+    for term in ["t", "te", "tes", "test", "tes", "b", "br", ""]:
+        expected = SearchIndex(index.items).filter(term)
+        assert index.filter(term) == expected
+
+
+def test_filter_matches_non_ascii_text_ignoring_case():
+    index = SearchIndex([
+        {"id": "cafe", "name": "CAFÉ Helper", "description": "Ordering"},
+        {"id": "plain", "name": "Plain", "description": "Nothing special"},
+    ])
+    assert [item["id"] for item in index.filter("café")] == ["cafe"]
+    assert [item["id"] for item in index.filter("é h")] == ["cafe"]
+    assert index.filter("ö") == []